@@ -43,13 +43,12 @@ Hints
 -----
 - You can use the function:
 
-from sklearn.metrics.pairwise import pairwise_distances
+from sklearn.metrics.pairwise import euclidean_distances
 
 to compute distances between 2 sets of samples.
 """
 import numpy as np
 import pandas as pd
-from collections import Counter
 
 from sklearn.base import BaseEstimator
 from sklearn.base import ClassifierMixin
@@ -59,28 +58,112 @@ from sklearn.model_selection import BaseCrossValidator
 from sklearn.utils.validation import check_X_y, check_is_fitted
 from sklearn.utils.validation import check_array
 from sklearn.utils.multiclass import check_classification_targets
-from sklearn.metrics.pairwise import pairwise_distances
+from sklearn.metrics.pairwise import euclidean_distances
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba is an optional speed-up, not a requirement
+    NUMBA_AVAILABLE = False
 
-def most_common_label(array):
-    """_summary_
-    Args:
-        array : the array of labels
-    Returns:
-        most_common : the most common label in the array
+try:
+    import faiss
+    FAISS_AVAILABLE = True
+except ImportError:  # faiss is an optional speed-up, not a requirement
+    FAISS_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _knn_predict_numba(X, X_train, y_int, k, n_classes):
+        """Fused distance + top-k + vote kernel, parallel over test rows.
+
+        Avoids materializing the full distance matrix: each thread keeps
+        one n_train distance buffer and a k-sized best-neighbor list.
+        """
+        n_test = X.shape[0]
+        n_train = X_train.shape[0]
+        n_features = X.shape[1]
+        y_pred = np.empty(n_test, dtype=np.int64)
+        for i in prange(n_test):
+            # Feature-major accumulation: with X_train in Fortran order
+            # each inner loop streams one contiguous feature column.
+            dists = np.zeros(n_train)
+            for f in range(n_features):
+                xf = X[i, f]
+                for j in range(n_train):
+                    diff = xf - X_train[j, f]
+                    dists[j] += diff * diff
+            # Seed the k-best list from the first k training points
+            # (k <= n_train is guaranteed at fit time) instead of an inf
+            # sentinel: comparisons against inf are undefined under
+            # fastmath's no-infinities assumption.
+            best_dist = np.empty(k)
+            best_label = np.empty(k, dtype=np.int32)
+            worst = 0
+            for j in range(k):
+                best_dist[j] = dists[j]
+                best_label[j] = y_int[j]
+                if best_dist[j] > best_dist[worst]:
+                    worst = j
+            for j in range(k, n_train):
+                if dists[j] < best_dist[worst]:
+                    best_dist[worst] = dists[j]
+                    best_label[worst] = y_int[j]
+                    # Rescan for the new worst of the current top-k.
+                    for m in range(k):
+                        if best_dist[m] > best_dist[worst]:
+                            worst = m
+            counts = np.zeros(n_classes, dtype=np.int32)
+            for m in range(k):
+                counts[best_label[m]] += 1
+            best_class = 0
+            for c in range(1, n_classes):
+                if counts[c] > counts[best_class]:
+                    best_class = c
+            y_pred[i] = best_class
+        return y_pred
+
+
+def _majority_vote(neigh_int, classes):
+    """Return the most frequent class for each row of neighbor labels.
+
+    Parameters
+    ----------
+    neigh_int : ndarray, shape (n_samples, k)
+        Neighbor labels encoded as indices into `classes`.
+    classes : ndarray, shape (n_classes,)
+        Sorted array of class labels.
+
+    Returns
+    -------
+    y : ndarray, shape (n_samples,)
+        Most common class per row. This is a row-wise np.bincount
+        followed by argmax, so ties resolve to the smallest class.
     """
-    counter = Counter(array)
-    most_common = counter.most_common(1)
-    # If there is a tie for the most common label, this will return the first \
-    # one encountered.
-    return most_common[0][0] if most_common else None
+    counts = np.zeros((neigh_int.shape[0], len(classes)), dtype=np.int32)
+    np.add.at(counts,
+              (np.arange(neigh_int.shape[0])[:, None], neigh_int), 1)
+    return classes[counts.argmax(axis=1)]
 
 
 class KNearestNeighbors(BaseEstimator, ClassifierMixin):
-    """KNearestNeighbors classifier."""
+    """KNearestNeighbors classifier.
 
-    def __init__(self, n_neighbors=1):  # noqa: D107
+    Parameters
+    ----------
+    n_neighbors : int, defaults to 1
+        Number of neighbors used in the majority vote.
+    backend : str, defaults to 'numpy'
+        Either 'numpy' for the in-process distance computation or 'faiss'
+        to delegate the neighbor search to a faiss index (GPU-backed when
+        GPUs are visible). 'faiss' requires the faiss package and is only
+        worthwhile for large training sets.
+    """
+
+    def __init__(self, n_neighbors=1, backend='numpy'):  # noqa: D107
         self.n_neighbors = n_neighbors
+        self.backend = backend
 
     def fit(self, X, y):
         """Fitting function.
@@ -97,12 +180,47 @@ class KNearestNeighbors(BaseEstimator, ClassifierMixin):
         self : instance of KNearestNeighbors
             The current instance of the classifier
         """
-        X, y = check_X_y(X, y)
+        # float32 halves the memory traffic of the distance
+        # computation with no practical effect on the ranking.
+        if self.backend not in ('numpy', 'faiss'):
+            raise ValueError(
+                f"backend must be 'numpy' or 'faiss', got "
+                f"{self.backend!r}")
+        X, y = check_X_y(X, y, dtype=np.float32)
         check_classification_targets(y)
-        self.X_ = X
+        # Keep self.X_ C-contiguous: euclidean_distances dispatches its
+        # -2*X@Y.T term to BLAS GEMM only on contiguous inputs, and would
+        # otherwise copy on every predict call.
+        self.X_ = np.ascontiguousarray(X)
         self.y_ = y
         self.n_features_in_ = X.shape[1]
         self.classes_ = np.unique(y)
+        # Integer-encoded labels so that the majority vote in `predict`
+        # can be done with C-level tallies instead of Python counters.
+        self._y_int = np.searchsorted(self.classes_, y).astype(np.int32)
+        # Effective neighbor count, clipped once here so the predict hot
+        # path slices with a plain integer instead of re-evaluating min().
+        self._k = min(self.n_neighbors, X.shape[0])
+        # The training matrix is fixed after fit, so its squared row norms
+        # can be computed once and reused by every predict call. They must
+        # be float64: euclidean_distances ignores a float32 norm cache and
+        # recomputes the norms on its internally upcast chunks.
+        self._X_norm_sq = \
+            (self.X_.astype(np.float64) ** 2).sum(axis=1).reshape(1, -1)
+        if NUMBA_AVAILABLE:
+            # Column-major copy for the numba kernel, which accumulates
+            # distances one feature column at a time; self.X_ stays
+            # C-contiguous for the sklearn GEMM path.
+            self._X_soa = np.asfortranarray(self.X_)
+        if self.backend == 'faiss':
+            if not FAISS_AVAILABLE:
+                raise ImportError(
+                    "backend='faiss' requires the faiss package")
+            self._index = faiss.IndexFlatL2(X.shape[1])
+            # CPU-only faiss builds do not expose the GPU helpers.
+            if getattr(faiss, 'get_num_gpus', lambda: 0)() > 0:
+                self._index = faiss.index_cpu_to_all_gpus(self._index)
+            self._index.add(np.ascontiguousarray(X, dtype=np.float32))
         return self
 
     def predict(self, X):
@@ -119,11 +237,47 @@ class KNearestNeighbors(BaseEstimator, ClassifierMixin):
             Predicted class labels for each test data sample.
         """
         check_is_fitted(self)
-        X = check_array(X)
-        closest = np.argsort(pairwise_distances(X, self.X_))[:,
-                                                             :self.n_neighbors]
-        y_pred = np.array([most_common_label(self.y_[closest[i]]) for i in
-                           range(X.shape[0])])
+        X = np.ascontiguousarray(check_array(X, dtype=np.float32))
+        # The fused kernels index the training matrix directly and would
+        # read garbage on a feature mismatch, so check before dispatch.
+        if X.shape[1] != self.n_features_in_:
+            raise ValueError(
+                f"X has {X.shape[1]} features, but KNearestNeighbors "
+                f"is expecting {self.n_features_in_} features as input")
+        if self.backend == 'faiss':
+            _, closest = self._index.search(
+                np.ascontiguousarray(X, dtype=np.float32), self._k)
+            return _majority_vote(self._y_int[closest], self.classes_)
+        if NUMBA_AVAILABLE:
+            labels = _knn_predict_numba(X, self._X_soa, self._y_int,
+                                        self._k, len(self.classes_))
+            return self.classes_[labels]
+        y_pred = np.empty(X.shape[0], dtype=self.y_.dtype)
+        # Process the test samples by chunks so that only a bounded
+        # chunk_size x n_train distance tile is in memory at any time.
+        chunk_size = 256
+        for start in range(0, X.shape[0], chunk_size):
+            chunk = X[start:start + chunk_size]
+            # Squared distances rank neighbors identically to Euclidean
+            # distances, so the per-pair sqrt can be skipped. Calling
+            # euclidean_distances directly (rather than pairwise_distances
+            # with n_jobs > 1) keeps the computation sequential at the
+            # Python level and leaves the threading to BLAS: joblib
+            # workers on top of a threaded BLAS oversubscribe the cores
+            # and slow the Euclidean case down (scikit-learn#8216).
+            distances = euclidean_distances(chunk, self.X_,
+                                            Y_norm_squared=self._X_norm_sq,
+                                            squared=True)
+            # Partial selection of the k smallest distances is enough for
+            # a majority vote, which does not depend on the neighbor
+            # order. self._k is already clipped to n_train in fit, so no
+            # bounds branch is needed here.
+            closest = np.argpartition(distances, self._k - 1,
+                                      axis=1)[:, :self._k]
+            # A single advanced-indexing gather pulls the whole
+            # (chunk_size, k) block of neighbor labels in one C call.
+            y_pred[start:start + chunk_size] = \
+                _majority_vote(self._y_int[closest], self.classes_)
         return y_pred
 
     def score(self, X, y):
@@ -141,9 +295,10 @@ class KNearestNeighbors(BaseEstimator, ClassifierMixin):
         score : float
             Accuracy of the model computed for the (X, y) pairs.
         """
-        check_classification_targets(y)
+        # No target re-validation here: fit already checked y, following
+        # the sklearn convention of validating in fit rather than score.
         y_pred = self.predict(X)
-        score = (y == y_pred).mean()
+        score = (np.asarray(y) == y_pred).mean()
         return score
 
 
@@ -166,6 +321,36 @@ class MonthlySplit(BaseCrossValidator):
     def __init__(self, time_col='index'):  # noqa: D107
         self.time_col = time_col
 
+    def _month_key(self, X):
+        """Encode the date of each row as a single integer month.
+
+        Parameters
+        ----------
+        X : array-like of shape (n_samples, n_features)
+            Data with a datetime index or column, as selected by
+            `time_col`.
+
+        Returns
+        -------
+        month_arr : ndarray of shape (n_samples,)
+            `year * 12 + month` of each row, computed with the vectorized
+            datetime accessors. Consecutive months map to consecutive
+            integers, so ordering and grouping on this key match ordering
+            and grouping on (year, month) pairs.
+        """
+        if self.time_col == 'index':
+            if not isinstance(X.index, pd.DatetimeIndex):
+                raise ValueError("Index of the DataFrame is not datetime")
+            dates = X.index
+        else:
+            if not isinstance(X[self.time_col], pd.Series) or \
+                    not pd.api.types.is_datetime64_any_dtype(
+                        X[self.time_col]):
+                raise ValueError("The splitting column is not a datetime")
+            dates = X[self.time_col].dt
+        return np.asarray(dates.year, dtype=np.int32) * 12 + \
+            np.asarray(dates.month, dtype=np.int32)
+
     def get_n_splits(self, X, y=None, groups=None):
         """Return the number of splitting iterations in the cross-validator.
 
@@ -184,13 +369,8 @@ class MonthlySplit(BaseCrossValidator):
         n_splits : int
             The number of splits.
         """
-        if self.time_col == 'index':
-            unique_year_month = set([(date.year, date.month)
-                                     for date in X.index])
-        else:
-            unique_year_month = set([(date.year, date.month)
-                                     for date in X[self.time_col]])
-        n_splits = len(unique_year_month)-1
+        unique_year_month = np.unique(self._month_key(X))
+        n_splits = unique_year_month.size - 1
         return n_splits
 
     def split(self, X, y, groups=None):
@@ -213,30 +393,32 @@ class MonthlySplit(BaseCrossValidator):
         idx_test : ndarray
             The testing set indices for that split.
         """
-        if self.time_col == 'index':
-            if not isinstance(X.index, pd.DatetimeIndex):
-                raise ValueError("Index of the DataFrame is not datetime")
-            df = X.index.map(lambda date: (date.year, date.month))
+        month_arr = self._month_key(X)
+        unique_year_month = np.unique(month_arr)
+        n_splits = unique_year_month.size - 1
+        if np.all(month_arr[:-1] <= month_arr[1:]):
+            # Data sorted by date: each month is one contiguous slice and
+            # searchsorted finds all the slice bounds in O(log n) each,
+            # instead of one full scan of month_arr per split.
+            starts = np.searchsorted(month_arr, unique_year_month,
+                                     side='left')
+            ends = np.searchsorted(month_arr, unique_year_month,
+                                   side='right')
+            for i in range(n_splits):
+                yield (
+                    np.arange(starts[i], ends[i]),
+                    np.arange(starts[i+1], ends[i+1])
+                )
         else:
-            if not isinstance(X[self.time_col], pd.Series) or \
-                    X[self.time_col].dtype != 'datetime64[ns]':
-                raise ValueError("The splitting column is not a datetime")
-            df = X[self.time_col].apply(lambda date: (date.year, date.month))
-        unique_year_month = sorted(set(df))
-        n_splits = self.get_n_splits(X, y, groups)
-        assert len(unique_year_month) == n_splits+1, "The number \
-        of unique year-month pairs must be equal to the n_split+1"
-        for i in range(n_splits):
-            idx_train = [X.index.get_loc(elm)
-                         for elm in X[df == unique_year_month[i]]
-                         .index.tolist()]
-            idx_test = [X.index.get_loc(elm)
-                        for elm in X[df == unique_year_month[i+1]]
-                        .index.tolist()]
-            yield (
-                idx_train, idx_test
-            )
-        df = None
+            for i in range(n_splits):
+                # Boolean masks give the positional indices directly,
+                # without the label-based X.index.get_loc lookups and
+                # without materializing a filtered copy of X per split.
+                idx_train = np.nonzero(month_arr == unique_year_month[i])[0]
+                idx_test = np.nonzero(month_arr == unique_year_month[i+1])[0]
+                yield (
+                    idx_train, idx_test
+                )
 
 
 def main():